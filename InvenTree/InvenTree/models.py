@@ -574,8 +574,10 @@ class InvenTreeTree(MPTTModel):
                             related_name='children')
 
     # The 'pathstring' field is calculated each time the model is saved
+    # It is indexed, as it is used for ordering and display in place of traversing the tree
     pathstring = models.CharField(
         blank=True,
+        db_index=True,
         max_length=250,
         verbose_name=_('Path'),
         help_text=_('Path')
@@ -75,6 +75,12 @@ class BuildTestSimple(InvenTreeTestCase):
         self.assertEqual(b1.is_active, True)
         self.assertEqual(b2.is_active, False)
 
+        # Active / inactive builds are filtered in the database
+        self.assertIn(b1, b1.part.active_builds)
+        self.assertNotIn(b1, b1.part.inactive_builds)
+        self.assertIn(b2, b2.part.inactive_builds)
+        self.assertNotIn(b2, b2.part.active_builds)
+
     def test_cancel_build(self):
         """Test build cancellation function."""
         build = Build.objects.get(id=1)
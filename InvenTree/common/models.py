@@ -1810,7 +1810,8 @@ def get_price(instance, quantity, moq=True, multiples=True, currency=None, break
     from common.settings import currency_code_default
 
     if hasattr(instance, break_name):
-        price_breaks = getattr(instance, break_name).all()
+        # Note: Calling .all() on a prefetched queryset would discard the cached results
+        price_breaks = getattr(instance, break_name)
     else:
         price_breaks = []
 
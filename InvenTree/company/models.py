@@ -37,15 +37,12 @@ def rename_company_image(instance, filename):
     """
     base = 'company_images'
 
-    if filename.count('.') > 0:
-        ext = filename.split('.')[-1]
-    else:
-        ext = ''
+    _, dot, ext = filename.rpartition('.')
 
-    fn = 'company_{pk}_img'.format(pk=instance.pk)
+    fn = f'company_{instance.pk}_img'
 
-    if ext:
-        fn += '.' + ext
+    if dot and ext:
+        fn += f'.{ext}'
 
     return os.path.join(base, fn)
 
@@ -583,7 +580,16 @@ class SupplierPart(InvenTreeBarcodeMixin, models.Model):
 
     @property
     def price_breaks(self):
-        """Return the associated price breaks in the correct order."""
+        """Return the associated price breaks in the correct order.
+
+        If the price breaks have been prefetched already sorted by quantity (see PartManager.with_related),
+        the cached queryset is returned. Otherwise, the price breaks are queried in order.
+        """
+        cached = getattr(self, '_prefetched_objects_cache', {}).get('pricebreaks', None)
+
+        if cached is not None and cached.query.order_by == ('quantity',):
+            return cached
+
         return self.pricebreaks.order_by('quantity').all()
 
     @property
@@ -651,8 +657,10 @@ class SupplierPart(InvenTreeBarcodeMixin, models.Model):
 
         s += f'{self.supplier.name} | {self.SKU}'
 
-        if self.manufacturer_string:
-            s = s + ' | ' + self.manufacturer_string
+        manufacturer_string = self.manufacturer_string
+
+        if manufacturer_string:
+            s = s + ' | ' + manufacturer_string
 
         return s
 
@@ -9,7 +9,7 @@ from django.test import TestCase
 from part.models import Part
 
 from .models import (Company, Contact, ManufacturerPart, SupplierPart,
-                     rename_company_image)
+                     SupplierPriceBreak, rename_company_image)
 
 
 class CompanySimpleTest(TestCase):
@@ -60,6 +60,9 @@ class CompanySimpleTest(TestCase):
         rn = rename_company_image(c, 'test2')
         self.assertEqual(rn, 'company_images' + os.path.sep + 'company_1_img')
 
+        rn = rename_company_image(c, 'test.image.jpeg')
+        self.assertEqual(rn, 'company_images' + os.path.sep + 'company_1_img.jpeg')
+
     def test_price_breaks(self):
         """Unit tests for price breaks"""
         self.assertTrue(self.acme0001.has_price_breaks)
@@ -72,6 +75,36 @@ class CompanySimpleTest(TestCase):
         self.assertEqual(self.zerglphs.price_breaks.count(), 0)
         self.assertEqual(self.zergm312.price_breaks.count(), 2)
 
+        # Price breaks are prefetched (in order) when fetching parts with related data
+        m2x4 = Part.objects.with_related(price_breaks=True).get(name='M2x4 LPHS')
+
+        with self.assertNumQueries(0):
+            for sp in m2x4.supplier_parts.all():
+                quantities = [pb.quantity for pb in sp.price_breaks]
+                self.assertEqual(quantities, sorted(quantities))
+                self.assertEqual(len(quantities), sp.price_breaks.count())
+                self.assertEqual(sp.has_price_breaks, len(quantities) > 0)
+
+    def test_price_breaks_unordered_prefetch(self):
+        """Price breaks prefetched without ordering must still be evaluated in order"""
+        sp = SupplierPart.objects.create(
+            part=self.acme0001.part,
+            supplier=self.acme0001.supplier,
+            SKU='ACME-ORDER',
+        )
+
+        # Create price breaks in reverse quantity order
+        SupplierPriceBreak.objects.create(part=sp, quantity=100, price=1)
+        SupplierPriceBreak.objects.create(part=sp, quantity=10, price=10)
+
+        expected = sp.get_price(1)
+        self.assertEqual(expected, 10)
+
+        prefetched = SupplierPart.objects.prefetch_related('pricebreaks').get(pk=sp.pk)
+
+        self.assertEqual([pb.quantity for pb in prefetched.price_breaks], [10, 100])
+        self.assertEqual(prefetched.get_price(1), expected)
+
     def test_quantity_pricing(self):
         """Simple test for quantity pricing."""
         p = self.acme0001.get_price
@@ -53,11 +53,8 @@ class PartResource(InvenTreeResource):
 
     def get_queryset(self):
         """Prefetch related data for quicker access."""
-        query = super().get_queryset()
+        query = models.Part.objects.with_related()
         query = query.prefetch_related(
-            'category',
-            'used_in',
-            'builds',
             'supplier_parts__purchase_order_line_items',
             'stock_items__allocations'
         )
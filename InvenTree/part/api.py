@@ -685,7 +685,6 @@ class PartRequirements(RetrieveAPI):
         part = self.get_object()
 
         data = {
-            "available_stock": part.available_stock,
             "on_order": part.on_order,
             "required_build_order_quantity": part.required_build_order_quantity(),
             "allocated_build_order_quantity": part.build_order_allocation_count(),
@@ -696,6 +695,9 @@ class PartRequirements(RetrieveAPI):
         data["allocated"] = data["allocated_build_order_quantity"] + data["allocated_sales_order_quantity"]
         data["required"] = data["required_build_order_quantity"] + data["required_sales_order_quantity"]
 
+        # Re-use the allocated quantity calculated above, rather than re-querying via part.available_stock
+        data["available_stock"] = max(part.total_stock - data["allocated"], 0)
+
         return Response(data)
 
 
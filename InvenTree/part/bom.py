@@ -4,9 +4,14 @@ Primarily BOM upload tools.
 """
 
 from collections import OrderedDict
+from io import BytesIO
 
 from django.utils.translation import gettext as _
 
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
+
 from company.models import ManufacturerPart, SupplierPart
 from InvenTree.helpers import DownloadFile, GetExportFormats, normalize
 
@@ -19,6 +24,62 @@ def IsValidBOMFormat(fmt):
     return fmt.strip().lower() in GetExportFormats()
 
 
+def ExportXlsxDataset(dataset, title='BOM'):
+    """Export a tablib dataset to xlsx using a 'write only' workbook.
+
+    Rows are streamed into the worksheet one at a time,
+    rather than constructing the entire grid of cells in memory before saving.
+
+    Formatting matches the tablib xlsx export (bold, frozen headers and wrapped multi-line values).
+
+    Args:
+        dataset: tablib.Dataset to export
+        title (str, optional): Worksheet title. Defaults to 'BOM'.
+
+    Returns:
+        Binary xlsx file data
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(title=title)
+
+    if dataset.headers:
+        ws.freeze_panes = 'A2'
+
+        bold = Font(bold=True)
+        header = []
+
+        for col in dataset.headers:
+            cell = WriteOnlyCell(ws, value=str(col))
+            cell.font = bold
+            header.append(cell)
+
+        ws.append(header)
+
+    wrap_text = Alignment(wrap_text=True)
+
+    for row in dataset:
+        cells = []
+
+        for col in row:
+            try:
+                cell = WriteOnlyCell(ws, value=col)
+            except (ValueError, TypeError):
+                cell = WriteOnlyCell(ws, value=str(col))
+
+            # Wrap multi-line values (e.g. notes)
+            if col is not None and '\n' in str(col):
+                cell.alignment = wrap_text
+
+            cells.append(cell)
+
+        ws.append(cells)
+
+    output = BytesIO()
+    wb.save(output)
+
+    return output.getvalue()
+
+
 def MakeBomTemplate(fmt):
     """Generate a Bill of Materials upload template file (for user download)."""
     fmt = fmt.strip().lower()
@@ -79,9 +140,11 @@ def ExportBom(part: Part, fmt='csv', cascade: bool = False, max_levels: int = No
 
             if cascade and item.sub_part.assembly:
                 if max_levels is None or level < max_levels:
-                    add_items(item.sub_part.bom_items.all().order_by('id'), level + 1)
+                    add_items(item.sub_part.bom_items.all().select_related('part', 'sub_part').order_by('id').iterator(), level + 1)
 
-    top_level_items = part.get_bom_items().order_by('id')
+    # Parent and sub-part data is exported for every line, so fetch it in the same query
+    # Rows are read in chunks, without populating a queryset cache for each level of the BOM
+    top_level_items = part.get_bom_items().select_related('part', 'sub_part').order_by('id').iterator()
 
     add_items(top_level_items, 1, cascade)
 
@@ -275,7 +338,10 @@ def ExportBom(part: Part, fmt='csv', cascade: bool = False, max_levels: int = No
         # Add supplier columns to dataset
         add_columns_to_dataset(manufacturer_cols, len(bom_items))
 
-    data = dataset.export(fmt)
+    if fmt == 'xlsx':
+        data = ExportXlsxDataset(dataset)
+    else:
+        data = dataset.export(fmt)
 
     filename = f"{part.full_name}_BOM.{fmt}"
 
@@ -19,9 +19,10 @@ Relevant PRs:
 from decimal import Decimal
 
 from django.db import models
-from django.db.models import (DecimalField, ExpressionWrapper, F, FloatField,
-                              Func, IntegerField, OuterRef, Q, Subquery)
-from django.db.models.functions import Coalesce
+from django.db.models import (Case, DecimalField, ExpressionWrapper, F,
+                              FloatField, Func, IntegerField, OuterRef, Q,
+                              Subquery, Value, When)
+from django.db.models.functions import Cast, Coalesce, Floor, Greatest
 
 from sql_util.utils import SubquerySum
 
@@ -210,3 +211,115 @@ def annotate_category_parts():
         0,
         output_field=IntegerField()
     )
+
+
+def annotate_bom_count():
+    """Construct a queryset annotation which returns the number of BOM items for a particular part.
+
+    - Includes BOM items defined directly against the part
+    - Includes 'inherited' BOM items defined against any template parts above it
+    - Mirrors the filter returned by Part.get_bom_item_filter()
+    """
+
+    subquery = part.models.BomItem.objects.filter(
+        Q(part=OuterRef('pk')) | Q(
+            inherited=True,
+            part__tree_id=OuterRef('tree_id'),
+            part__lft__lt=OuterRef('lft'),
+            part__rght__gt=OuterRef('rght'),
+        )
+    )
+
+    return Coalesce(
+        Subquery(
+            subquery.annotate(
+                total=Func(F('pk'), function='COUNT', output_field=IntegerField())
+            ).values('total'),
+        ),
+        0,
+        output_field=IntegerField()
+    )
+
+
+def annotate_bom_item_can_build(queryset):
+    """Annotate a BomItem queryset with the number of assemblies which can be built from each BOM line.
+
+    - Available stock is calculated as (total stock - allocated stock) for the sub_part
+    - Available stock includes substitute parts (and variant parts, if allowed)
+    - 'Consumable' BOM items do not limit the build quantity, and are excluded
+    - BOM items with a zero quantity are excluded (to avoid division by zero)
+
+    Args:
+        queryset: BomItem queryset
+
+    Returns:
+        BomItem queryset with the 'can_build' annotation
+    """
+
+    queryset = queryset.filter(consumable=False, quantity__gt=0)
+
+    ref = 'sub_part__'
+    sub_ref = 'substitutes__part__'
+    variant_query = variant_stock_query(reference=ref)
+
+    # Available stock for each BOM item sub_part, substitute parts and variant parts
+    queryset = queryset.alias(
+        available_stock=ExpressionWrapper(
+            annotate_total_stock(reference=ref) - annotate_sales_order_allocations(reference=ref) - annotate_build_order_allocations(reference=ref),
+            output_field=DecimalField(),
+        ),
+        substitute_stock=ExpressionWrapper(
+            annotate_total_stock(reference=sub_ref) - annotate_sales_order_allocations(reference=sub_ref) - annotate_build_order_allocations(reference=sub_ref),
+            output_field=DecimalField(),
+        ),
+        variant_stock=ExpressionWrapper(
+            annotate_variant_quantity(variant_query, reference='quantity') - annotate_variant_quantity(variant_query, reference='allocations__quantity') - annotate_variant_quantity(variant_query, reference='sales_order_allocations__quantity'),
+            output_field=DecimalField(),
+        ),
+    )
+
+    # Calculate the number of units which can be built from each BOM item
+    return queryset.annotate(
+        can_build=Cast(
+            Floor(
+                ExpressionWrapper(
+                    (F('available_stock') + F('substitute_stock') + Case(
+                        When(allow_variants=True, then=F('variant_stock')),
+                        default=Value(0),
+                        output_field=DecimalField(),
+                    )) / F('quantity'),
+                    output_field=DecimalField(),
+                )
+            ),
+            output_field=IntegerField(),
+        )
+    )
+
+
+def annotate_can_build():
+    """Construct a queryset annotation which returns the number of units of each part which can be built with available stock.
+
+    - Includes 'inherited' BOM items defined against any template parts above it
+    - The limiting BOM item (refer to annotate_bom_item_can_build) determines the buildable quantity
+    """
+
+    bom_items = part.models.BomItem.objects.filter(
+        Q(part=OuterRef('pk')) | Q(
+            inherited=True,
+            part__tree_id=OuterRef('tree_id'),
+            part__lft__lt=OuterRef('lft'),
+            part__rght__gt=OuterRef('rght'),
+        )
+    )
+
+    bom_items = annotate_bom_item_can_build(bom_items)
+
+    return Greatest(
+        Coalesce(
+            Subquery(bom_items.order_by('can_build').values('can_build')[:1]),
+            0,
+            output_field=IntegerField(),
+        ),
+        0,
+        output_field=IntegerField(),
+    )
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.16 on 2026-10-15 21:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('part', '0089_alter_partcategory_pathstring'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='part',
+            index=models.Index(fields=['category', 'salable'], name='part_category_salable_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='part',
+            index=models.Index(fields=['assembly', 'active'], name='part_assembly_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='bomitem',
+            index=models.Index(fields=['part', 'sub_part'], name='bomitem_part_sub_part_idx'),
+        ),
+    ]
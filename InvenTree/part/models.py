@@ -13,12 +13,14 @@ from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
 from django.db import models, transaction
-from django.db.models import ExpressionWrapper, F, Q, Sum, UniqueConstraint
-from django.db.models.functions import Coalesce
+from django.db.models import (ExpressionWrapper, F, Func, OuterRef, Prefetch,
+                              Q, Subquery, Sum, UniqueConstraint)
+from django.db.models.functions import Coalesce, Greatest
 from django.db.models.signals import post_save
 from django.db.utils import IntegrityError
 from django.dispatch import receiver
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from django_cleanup import cleanup
@@ -28,6 +30,7 @@ from jinja2 import Template
 from mptt.exceptions import InvalidMove
 from mptt.managers import TreeManager
 from mptt.models import MPTTModel, TreeForeignKey
+from sql_util.utils import SubqueryCount
 from stdimage.models import StdImageField
 
 import common.models
@@ -38,7 +41,7 @@ import part.settings as part_settings
 from build import models as BuildModels
 from common.models import InvenTreeSetting
 from common.settings import currency_code_default
-from company.models import SupplierPart
+from company.models import SupplierPart, SupplierPriceBreak
 from InvenTree import helpers, validators
 from InvenTree.fields import InvenTreeNotesField, InvenTreeURLField
 from InvenTree.helpers import decimal2money, decimal2string, normalize
@@ -47,6 +50,8 @@ from InvenTree.models import (DataImportMixin, InvenTreeAttachment,
 from InvenTree.status_codes import (BuildStatus, PurchaseOrderStatus,
                                     SalesOrderStatus)
 from order import models as OrderModels
+from plugin.base.event.events import allow_table_event
+from plugin.events import trigger_event
 from plugin.models import MetadataMixin
 from stock import models as StockModels
 
@@ -74,11 +79,20 @@ class PartCategory(MetadataMixin, InvenTreeTree):
             tree_id = self.tree_id
 
             # Update each part in this category to point to the parent category
-            for p in self.parts.all():
-                p.category = self.parent
-                p.save()
+            # Performed as a single bulk UPDATE, as Part.save() has no category-dependent side effects
+            # Note: QuerySet.update() does not send post_save signals, so the generic plugin event is triggered for each part
+            part_ids = list(self.parts.values_list('pk', flat=True))
+
+            self.parts.update(category=self.parent)
+
+            table = Part._meta.db_table
+
+            if allow_table_event(table):
+                for pk in part_ids:
+                    trigger_event(f'{table}.saved', id=pk, model=Part.__name__)
 
             # Update each child category
+            # Note: These must be saved individually, so that the tree structure and pathstring values are updated
             for child in self.children.all():
                 child.parent = self.parent
                 child.save()
@@ -133,7 +147,12 @@ class PartCategory(MetadataMixin, InvenTreeTree):
         """
         if cascade:
             """Select any parts which exist in this category or any child categories."""
-            queryset = Part.objects.filter(category__in=self.getUniqueChildren(include_self=True))
+            # Match against the MPTT tree range, so the entire subtree is covered by a single query
+            queryset = Part.objects.filter(
+                category__tree_id=self.tree_id,
+                category__lft__gte=self.lft,
+                category__rght__lte=self.rght,
+            )
         else:
             queryset = Part.objects.filter(category=self.pk)
 
@@ -298,6 +317,50 @@ class PartManager(TreeManager):
             'builds',
         )
 
+    def with_related(self, can_build=False, price_breaks=False):
+        """Return a queryset which also fetches related data required when rendering a list of parts.
+
+        - Forward relationships are joined in the same query
+        - Supplier parts are prefetched
+        - Only "in stock" items are prefetched, and only the fields required to calculate stock levels
+        - BOM and supplier counts are annotated, to avoid a COUNT query per part
+
+        Note: The default prefetch operations (refer to get_queryset) are not performed here.
+
+        Args:
+            can_build: If True, also annotate the quantity which can be built (this is an expensive subquery)
+            price_breaks: If True, also prefetch supplier price breaks (sorted by quantity) for pricing calculations
+        """
+        in_stock_items = StockModels.StockItem.objects.filter(
+            StockModels.StockItem.IN_STOCK_FILTER
+        ).prefetch_related(None).only('pk', 'part', 'quantity')
+
+        queryset = super().get_queryset().select_related(
+            'category',
+            'default_location',
+            'default_supplier',
+        ).prefetch_related(
+            Prefetch('stock_items', queryset=in_stock_items, to_attr='_in_stock_items'),
+        ).annotate(
+            _bom_count=part_filters.annotate_bom_count(),
+            _supplier_count=SubqueryCount('supplier_parts'),
+        )
+
+        if price_breaks:
+            # Price breaks are sorted in the database (refer to SupplierPart.price_breaks)
+            queryset = queryset.prefetch_related(
+                Prefetch('supplier_parts', queryset=SupplierPart.objects.prefetch_related(
+                    Prefetch('pricebreaks', queryset=SupplierPriceBreak.objects.order_by('quantity'))
+                ))
+            )
+        else:
+            queryset = queryset.prefetch_related('supplier_parts')
+
+        if can_build:
+            queryset = queryset.annotate(_can_build=part_filters.annotate_can_build())
+
+        return queryset
+
 
 @cleanup.ignore
 class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
@@ -338,6 +401,14 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
 
     objects = PartManager()
 
+    # Properties which are cached against the instance (refer to clear_cached_properties)
+    CACHED_PROPERTIES = [
+        'bom_count',
+        'has_bom',
+        'used_in_count',
+        'supplier_count',
+    ]
+
     class Meta:
         """Metaclass defines extra model properties"""
         verbose_name = _("Part")
@@ -346,6 +417,10 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         constraints = [
             UniqueConstraint(fields=['name', 'IPN', 'revision'], name='unique_part')
         ]
+        indexes = [
+            models.Index(fields=['category', 'salable'], name='part_category_salable_idx'),
+            models.Index(fields=['assembly', 'active'], name='part_assembly_active_idx'),
+        ]
 
     class MPTTMeta:
         """MPTT metaclass definitions"""
@@ -390,12 +465,13 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         context['required_sales_order_quantity'] = self.required_sales_order_quantity()
         context['allocated_sales_order_quantity'] = self.sales_order_allocation_count(pending=True)
 
-        context['available'] = self.available_stock
-        context['on_order'] = self.on_order
-
         context['required'] = context['required_build_order_quantity'] + context['required_sales_order_quantity']
         context['allocated'] = context['allocated_build_order_quantity'] + context['allocated_sales_order_quantity']
 
+        # Re-use the values calculated above, rather than re-querying via self.available_stock
+        context['available'] = max(context['total_stock'] - context['allocated'], 0)
+        context['on_order'] = self.on_order
+
         return context
 
     def save(self, *args, **kwargs):
@@ -491,9 +567,10 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         a) The parent part is the same as this one
         b) The parent part is used in the BOM for *this* part
         c) The parent part is used in the BOM for any child parts under this one
-        """
-        result = True
 
+        The BOM is traversed one level at a time, so the number of queries scales with the depth of the BOM
+        (rather than the total number of BOM items). Each sub-assembly is only checked once.
+        """
         try:
             if self.pk == parent.pk:
                 raise ValidationError({'sub_part': _("Part '{p1}' is  used in BOM for '{p2}' (recursive)").format(
@@ -501,25 +578,45 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
                     p2=str(parent)
                 )})
 
-            bom_items = self.get_bom_items()
+            # Maximum number of parts checked in a single query
+            batch_size = 250
+
+            # Parts for which the BOM is checked at the current level
+            level = {self.pk}
+            checked = set(level)
+
+            while level:
+                sub_parts = set()
 
-            # Ensure that the parent part does not appear under any child BOM item!
-            for item in bom_items.all():
+                # Wide BOM levels are checked in batches, to limit the size of each query
+                pks = list(level)
 
-                # Check for simple match
-                if item.sub_part == parent:
+                for idx in range(0, len(pks), batch_size):
+                    batch = pks[idx:idx + batch_size]
+
+                    bom_filter = Q(part__in=batch)
+
+                    # Inherited BOM items from template parts must be considered also (refer to get_bom_item_filter)
+                    # Only variant parts (level > 0) have any ancestors
+                    variants = Part.objects.filter(pk__in=batch, level__gt=0).prefetch_related(None)
+                    ancestors = Part.objects.get_queryset_ancestors(variants, include_self=False)
+
+                    bom_filter |= Q(part__in=ancestors, inherited=True)
+
+                    sub_parts |= set(BomItem.objects.filter(bom_filter).values_list('sub_part', flat=True))
+
+                # Ensure that the parent part does not appear under any child BOM item!
+                if parent.pk in sub_parts:
                     raise ValidationError({'sub_part': _("Part '{p1}' is  used in BOM for '{p2}' (recursive)").format(
                         p1=str(parent),
                         p2=str(self)
                     )})
 
-                # And recursively check too
-                if recursive:
-                    result = result and item.sub_part.check_add_to_bom(
-                        parent,
-                        recursive=True,
-                        raise_error=raise_error
-                    )
+                if not recursive:
+                    break
+
+                level = sub_parts - checked
+                checked |= level
 
         except ValidationError as e:
             if raise_error:
@@ -527,7 +624,7 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
             else:
                 return False
 
-        return result
+        return True
 
     def validate_serial_number(self, serial: str, stock_item=None, check_duplicates=True, raise_error=False):
         """Validate a serial number against this Part instance.
@@ -986,27 +1083,61 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         return builds
 
     def required_build_order_quantity(self):
-        """Return the quantity of this part required for active build orders."""
-        # List active build orders which reference this part
-        builds = self.requiring_build_orders()
-
-        quantity = 0
-
-        for build in builds:
-
-            bom_item = None
+        """Return the quantity of this part required for active build orders.
 
-            # List the bom lines required to make the build (including inherited ones!)
-            bom_items = build.part.get_bom_items().filter(sub_part=self)
+        The quantity is calculated in a single query, against each BomItem which references this part:
 
-            # Match BOM item to build
-            for bom_item in bom_items:
+        - Active builds for the BomItem part require (build quantity * BOM quantity)
+        - If the BomItem is inherited, active builds for variants of the BomItem part are also included
+        """
+        active_builds = BuildModels.Build.objects.filter(status__in=BuildStatus.ACTIVE_CODES)
+
+        def build_quantity(builds):
+            """Return a subquery annotation for the total quantity of the provided builds"""
+            return Coalesce(
+                Subquery(
+                    builds.annotate(
+                        total=Func(F('quantity'), function='SUM', output_field=models.IntegerField())
+                    ).values('total')
+                ),
+                0,
+                output_field=models.IntegerField(),
+            )
 
-                build_quantity = build.quantity * bom_item.quantity
+        queryset = BomItem.objects.filter(sub_part=self).annotate(
+            # Active builds for the part which the BomItem belongs to
+            build_quantity=build_quantity(
+                active_builds.filter(part=OuterRef('part'))
+            ),
+            # Active builds for any variants underneath the part which the BomItem belongs to
+            variant_build_quantity=build_quantity(
+                active_builds.filter(
+                    part__tree_id=OuterRef('part__tree_id'),
+                    part__lft__gt=OuterRef('part__lft'),
+                    part__rght__lt=OuterRef('part__rght'),
+                )
+            ),
+        )
 
-                quantity += build_quantity
+        query = queryset.aggregate(
+            direct=Coalesce(
+                Sum(
+                    ExpressionWrapper(F('quantity') * F('build_quantity'), output_field=models.DecimalField()),
+                ),
+                Decimal(0),
+                output_field=models.DecimalField(),
+            ),
+            inherited=Coalesce(
+                Sum(
+                    ExpressionWrapper(F('quantity') * F('variant_build_quantity'), output_field=models.DecimalField()),
+                    filter=Q(inherited=True),
+                ),
+                Decimal(0),
+                output_field=models.DecimalField(),
+            ),
+        )
 
-        return quantity
+        return query['direct'] + query['inherited']
 
     def requiring_sales_orders(self):
         """Return a list of sales orders which require this part."""
@@ -1031,14 +1162,19 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
             part=self
         )
 
-        quantity = 0
-
-        for line in open_lines:
-            # Determine the quantity "remaining" to be shipped out
-            remaining = max(line.quantity - line.shipped, 0)
-            quantity += remaining
+        # Sum the quantity "remaining" to be shipped out for each line
+        query = open_lines.aggregate(
+            total=Coalesce(
+                Sum(
+                    Greatest(F('quantity') - F('shipped'), Decimal(0), output_field=models.DecimalField()),
+                    output_field=models.DecimalField(),
+                ),
+                Decimal(0),
+                output_field=models.DecimalField(),
+            )
+        )
 
-        return quantity
+        return query['total']
 
     def required_order_quantity(self):
         """Return total required to fulfil orders."""
@@ -1140,85 +1276,24 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
 
     @property
     def can_build(self):
-        """Return the number of units that can be build with available stock."""
-        # If this part does NOT have a BOM, result is simply the currently available stock
-        if not self.has_bom:
-            return 0
-
-        total = None
+        """Return the number of units that can be build with available stock.
 
-        # Prefetch related tables, to reduce query expense
-        queryset = self.get_bom_items()
+        All stock quantities are calculated using subquery annotations (refer to part.filters.annotate_bom_item_can_build),
+        so the entire BOM is evaluated in a single database query.
 
-        # Ignore 'consumable' BOM items for this calculation
-        queryset = queryset.filter(consumable=False)
-
-        queryset = queryset.prefetch_related(
-            'sub_part__stock_items',
-            'sub_part__stock_items__allocations',
-            'sub_part__stock_items__sales_order_allocations',
-            'substitutes',
-            'substitutes__part__stock_items',
-        )
-
-        # Annotate the 'available stock' for each part in the BOM
-        ref = 'sub_part__'
-        queryset = queryset.alias(
-            total_stock=part_filters.annotate_total_stock(reference=ref),
-            so_allocations=part_filters.annotate_sales_order_allocations(reference=ref),
-            bo_allocations=part_filters.annotate_build_order_allocations(reference=ref),
-        )
-
-        # Calculate the 'available stock' based on previous annotations
-        queryset = queryset.annotate(
-            available_stock=ExpressionWrapper(
-                F('total_stock') - F('so_allocations') - F('bo_allocations'),
-                output_field=models.DecimalField(),
-            )
-        )
-
-        # Extract similar information for any 'substitute' parts
-        ref = 'substitutes__part__'
-        queryset = queryset.alias(
-            sub_total_stock=part_filters.annotate_total_stock(reference=ref),
-            sub_so_allocations=part_filters.annotate_sales_order_allocations(reference=ref),
-            sub_bo_allocations=part_filters.annotate_build_order_allocations(reference=ref),
-        )
-
-        queryset = queryset.annotate(
-            substitute_stock=ExpressionWrapper(
-                F('sub_total_stock') - F('sub_so_allocations') - F('sub_bo_allocations'),
-                output_field=models.DecimalField(),
-            )
-        )
-
-        # Extract similar information for any 'variant' parts
-        variant_stock_query = part_filters.variant_stock_query(reference='sub_part__')
-
-        queryset = queryset.alias(
-            var_total_stock=part_filters.annotate_variant_quantity(variant_stock_query, reference='quantity'),
-            var_bo_allocations=part_filters.annotate_variant_quantity(variant_stock_query, reference='allocations__quantity'),
-            var_so_allocations=part_filters.annotate_variant_quantity(variant_stock_query, reference='sales_order_allocations__quantity'),
-        )
-
-        queryset = queryset.annotate(
-            variant_stock=ExpressionWrapper(
-                F('var_total_stock') - F('var_bo_allocations') - F('var_so_allocations'),
-                output_field=models.DecimalField(),
-            )
-        )
-
-        for item in queryset.all():
-            # Iterate through each item in the queryset, work out the limiting quantity
-            quantity = item.available_stock + item.substitute_stock
+        If the queryset has been annotated via PartManager.with_related(can_build=True),
+        the annotated value is returned directly.
+        """
+        if getattr(self, '_can_build', None) is not None:
+            return self._can_build
 
-            if item.allow_variants:
-                quantity += item.variant_stock
+        # Related objects are not required, as the stock levels are annotated
+        queryset = self.get_bom_items().prefetch_related(None)
 
-            n = int(quantity / item.quantity)
+        queryset = part_filters.annotate_bom_item_can_build(queryset)
 
-            if total is None or n < total:
-                total = n
+        # The limiting BOM item determines the buildable quantity
+        total = queryset.order_by('can_build').values_list('can_build', flat=True).first()
 
         if total is None:
             total = 0
@@ -1233,6 +1308,11 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         """
         return self.builds.filter(status__in=BuildStatus.ACTIVE_CODES)
 
+    @property
+    def inactive_builds(self):
+        """Return a list of builds which are no longer active (i.e. 'complete' or 'cancelled')."""
+        return self.builds.exclude(status__in=BuildStatus.ACTIVE_CODES)
+
     @property
     def quantity_being_built(self):
         """Return the current number of parts currently being built.
@@ -1240,15 +1320,23 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         Note: This is the total quantity of Build orders, *not* the number of build outputs.
               In this fashion, it is the "projected" quantity of builds
         """
-        builds = self.active_builds
-
-        quantity = 0
-
-        for build in builds:
-            # The remaining items in the build
-            quantity += build.remaining
+        # Sum the remaining items in each build
+        # Note: Subtract from the larger value, as unsigned columns (MySQL) cannot go below zero
+        query = self.active_builds.aggregate(
+            total=Coalesce(
+                Sum(
+                    ExpressionWrapper(
+                        Greatest(F('quantity'), F('completed')) - F('completed'),
+                        output_field=models.IntegerField(),
+                    ),
+                    output_field=models.IntegerField(),
+                ),
+                0,
+                output_field=models.IntegerField(),
+            )
+        )
 
-        return quantity
+        return query['total']
 
     def build_order_allocations(self, **kwargs):
         """Return all 'BuildItem' objects which allocate this part to Build objects."""
@@ -1337,12 +1425,7 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
             # If this instance has not been saved, foreign-key lookups will fail
             return 0
 
-        return sum(
-            [
-                self.build_order_allocation_count(**kwargs),
-                self.sales_order_allocation_count(**kwargs),
-            ],
-        )
+        return self.build_order_allocation_count(**kwargs) + self.sales_order_allocation_count(**kwargs)
 
     def stock_entries(self, include_variants=True, in_stock=None):
         """Return all stock entries for this Part.
@@ -1365,7 +1448,16 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         return query
 
     def get_stock_count(self, include_variants=True):
-        """Return the total "in stock" count for this part."""
+        """Return the total "in stock" count for this part.
+
+        If "in stock" items have been prefetched (see PartManager.with_related) they are used instead.
+        The prefetched items only cover this part, so cannot be used if variant parts exist underneath it.
+        """
+        in_stock_items = getattr(self, '_in_stock_items', None)
+
+        if in_stock_items is not None and (not include_variants or self.is_leaf_node()):
+            return sum((item.quantity for item in in_stock_items), Decimal(0))
+
         entries = self.stock_entries(in_stock=True, include_variants=include_variants)
 
         query = entries.aggregate(t=Coalesce(Sum('quantity'), Decimal(0)))
@@ -1527,9 +1619,22 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         """
         return Part.objects.filter(self.get_used_in_filter(include_inherited=include_inherited))
 
-    @property
+    def clear_cached_properties(self):
+        """Clear any cached property values for this Part instance.
+
+        Cached values are cleared automatically when the Part is saved.
+        If related data (e.g. BOM items or supplier parts) are modified without saving the Part
+        (for example, via inline forms in the admin interface), this must be called explicitly.
+        """
+        for attr in self.CACHED_PROPERTIES:
+            self.__dict__.pop(attr, None)
+
+    @cached_property
     def has_bom(self):
         """Return True if this Part instance has any BOM items"""
+        if getattr(self, '_bom_count', None) is not None:
+            return self._bom_count > 0
+
         return self.get_bom_items().exists()
 
     def get_trackable_parts(self):
@@ -1547,12 +1652,18 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
         """
         return self.get_trackable_parts().exists()
 
-    @property
+    @cached_property
     def bom_count(self):
-        """Return the number of items contained in the BOM for this part."""
+        """Return the number of items contained in the BOM for this part.
+
+        If the queryset has been annotated (see PartManager.with_related), the annotated value is used.
+        """
+        if getattr(self, '_bom_count', None) is not None:
+            return self._bom_count
+
         return self.get_bom_items().count()
 
-    @property
+    @cached_property
     def used_in_count(self):
         """Return the number of part BOMs that this part appears in."""
         return self.get_used_in().count()
@@ -1629,9 +1740,15 @@ class Part(InvenTreeBarcodeMixin, MetadataMixin, MPTTModel):
 
         return parts
 
-    @property
+    @cached_property
     def supplier_count(self):
-        """Return the number of supplier parts available for this part."""
+        """Return the number of supplier parts available for this part.
+
+        If the queryset has been annotated (see PartManager.with_related), the annotated value is used.
+        """
+        if getattr(self, '_supplier_count', None) is not None:
+            return self._supplier_count
+
         return self.supplier_parts.count()
 
     @property
@@ -2184,6 +2301,12 @@ def after_save_part(sender, instance: Part, created, **kwargs):
         InvenTree.tasks.offload_task(part_tasks.notify_low_stock_if_required, instance)
 
 
+@receiver(post_save, sender=Part, dispatch_uid='part_post_save_clear_cache')
+def clear_part_cached_properties(sender, instance: Part, **kwargs):
+    """Clear cached property values when a Part is saved."""
+    instance.clear_cached_properties()
+
+
 class PartAttachment(InvenTreeAttachment):
     """Model for storing file attachments against a Part object."""
 
@@ -2643,6 +2766,60 @@ class BomItem(DataImportMixin, models.Model):
         self.clean()
         super().save(*args, **kwargs)
 
+    @classmethod
+    def bulk_import(cls, rows, batch_size=500):
+        """Create multiple BomItem objects from a list of field data, using batched INSERT queries.
+
+        - Each item is validated via clean(), as per the save() method
+        - Rows which duplicate an existing (or previously imported) part / sub_part pair are ignored
+        - A post_save signal is sent for each created item (e.g. to trigger plugin events), as per the save() method
+
+        Note: As items are not saved individually, circular references are checked against the existing BOM data only.
+
+        Args:
+            rows: List of dicts containing BomItem field values
+            batch_size: Maximum number of items to insert per query (default = 500)
+
+        Returns:
+            A list of the newly created BomItem objects (with primary key values assigned)
+        """
+        items = [cls(**row) for row in rows]
+
+        parts = {item.part_id for item in items}
+
+        # Existing (part, sub_part) pairs are fetched in a single query
+        existing = set(cls.objects.filter(part__in=parts).values_list('part', 'sub_part'))
+
+        new_items = []
+
+        for item in items:
+            key = (item.part_id, item.sub_part_id)
+
+            if key in existing:
+                continue
+
+            item.clean()
+
+            existing.add(key)
+            new_items.append(item)
+
+        created = cls.objects.bulk_create(new_items, batch_size=batch_size)
+
+        # Not all database backends (e.g. SQLite, MySQL) return primary key values from bulk_create
+        if any(item.pk is None for item in created):
+            ids = {
+                (part_id, sub_part_id): pk for pk, part_id, sub_part_id in cls.objects.filter(part__in=parts).values_list('pk', 'part', 'sub_part')
+            }
+
+            for item in created:
+                item.pk = ids.get((item.part_id, item.sub_part_id))
+
+        # bulk_create() does not send post_save signals
+        for item in created:
+            post_save.send(sender=cls, instance=item, created=True, raw=False, using=cls.objects.db, update_fields=None)
+
+        return created
+
     # A link to the parent part
     # Each part will get a reverse lookup field 'bom_items'
     part = models.ForeignKey(Part, on_delete=models.CASCADE, related_name='bom_items',
@@ -2799,6 +2976,9 @@ class BomItem(DataImportMixin, models.Model):
     class Meta:
         """Metaclass providing extra model definition"""
         verbose_name = _("BOM Item")
+        indexes = [
+            models.Index(fields=['part', 'sub_part'], name='bomitem_part_sub_part_idx'),
+        ]
 
     def __str__(self):
         """Return a string representation of this BomItem instance"""
@@ -1021,7 +1021,7 @@ class BomImportSubmitSerializer(serializers.Serializer):
         """POST: Perform final save of submitted BOM data:
 
         - By this stage each line in the BOM has been validated
-        - Individually 'save' (create) each BomItem line
+        - Create the BomItem lines in bulk (duplicate lines are ignored)
         """
         data = self.validated_data
 
@@ -1029,18 +1029,7 @@ class BomImportSubmitSerializer(serializers.Serializer):
 
         try:
             with transaction.atomic():
-
-                for item in items:
-
-                    part = item['part']
-                    sub_part = item['sub_part']
-
-                    # Ignore duplicate BOM items
-                    if BomItem.objects.filter(part=part, sub_part=sub_part).exists():
-                        continue
-
-                    # Create a new BomItem object
-                    BomItem.objects.create(**item)
+                BomItem.bulk_import(items)
 
         except Exception as e:
             raise serializers.ValidationError(detail=serializers.as_serializer_error(e))
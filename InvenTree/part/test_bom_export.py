@@ -1,11 +1,16 @@
 """Unit testing for BOM export functionality."""
 
 import csv
+import io
 
 from django.urls import reverse
 
+import openpyxl
+
 from InvenTree.helpers import InvenTreeTestCase
 
+from .models import BomItem
+
 
 class BomExportTest(InvenTreeTestCase):
     """Class for performing unit testing of BOM export functionality"""
@@ -165,10 +170,34 @@ class BomExportTest(InvenTreeTestCase):
             'manufacturer_data': True,
         }
 
+        # Add a multi-line note to a BOM item
+        note = 'First line\nSecond line'
+        BomItem.objects.filter(pk=1).update(note=note)
+
         response = self.client.get(self.url, data=params)
 
         self.assertEqual(response.status_code, 200)
 
+        # Read the exported workbook
+        workbook = openpyxl.load_workbook(io.BytesIO(response.getvalue()))
+        worksheet = workbook.active
+        rows = list(worksheet.iter_rows())
+
+        headers = [cell.value for cell in rows[0]]
+
+        self.assertIn('level', headers)
+        self.assertIn('part_id', headers)
+        self.assertGreater(len(rows), 1)
+
+        # Header cells are bold
+        self.assertTrue(all(cell.font.b for cell in rows[0]))
+
+        # Multi-line values are wrapped
+        note_cells = [row[headers.index('note')] for row in rows[1:] if row[headers.index('note')].value == note]
+
+        self.assertEqual(len(note_cells), 1)
+        self.assertTrue(note_cells[0].alignment.wrap_text)
+
     def test_export_json(self):
         """Test BOM download in JSON format."""
         params = {
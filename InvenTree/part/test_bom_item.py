@@ -5,9 +5,11 @@ from decimal import Decimal
 
 import django.core.exceptions as django_exceptions
 from django.db import transaction
+from django.db.models.signals import post_save
 from django.test import TestCase
 
 import stock.models
+from build.models import Build
 
 from .models import BomItem, BomItemSubstitute, Part
 
@@ -44,6 +46,28 @@ class BomItemTest(TestCase):
 
         self.assertEqual(self.bob.bom_count, 4)
 
+        # Annotated BOM count should match the calculated value
+        bob = Part.objects.with_related().get(pk=self.bob.pk)
+        orphan = Part.objects.with_related().get(pk=self.orphan.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(bob.bom_count, 4)
+            self.assertTrue(bob.has_bom)
+            self.assertFalse(orphan.has_bom)
+
+        # Calculated values are cached against the instance
+        with self.assertNumQueries(0):
+            self.assertEqual(self.bob.bom_count, 4)
+            self.assertTrue(self.bob.has_bom)
+
+        # Cached values are cleared when the part is saved
+        component = Part.objects.create(name='Comp', description='A component', component=True)
+        BomItem.objects.create(part=self.bob, sub_part=component, quantity=1)
+        self.assertEqual(self.bob.bom_count, 4)
+
+        self.bob.save()
+        self.assertEqual(self.bob.bom_count, 5)
+
     def test_in_bom(self):
         """Test BOM aggregation"""
         parts = self.bob.getRequiredParts()
@@ -64,6 +88,118 @@ class BomItemTest(TestCase):
             item = BomItem.objects.create(part=self.bob, sub_part=self.bob, quantity=7)
             item.clean()  # pragma: no cover
 
+    def test_recursive_reference(self):
+        """Test that a BOM cannot contain a circular reference at any depth."""
+        a = Part.objects.create(name='A', description='Top assembly', assembly=True, component=True)
+        b = Part.objects.create(name='B', description='Sub assembly', assembly=True, component=True)
+        c = Part.objects.create(name='C', description='Sub-sub assembly', assembly=True, component=True)
+
+        BomItem.objects.create(part=a, sub_part=b, quantity=1)
+        BomItem.objects.create(part=b, sub_part=c, quantity=1)
+
+        # C is directly in the BOM for B
+        self.assertFalse(b.check_add_to_bom(c))
+        self.assertFalse(b.check_add_to_bom(c, recursive=False))
+
+        # C is not directly in the BOM for A, but is found further down
+        self.assertFalse(a.check_add_to_bom(c))
+        self.assertTrue(a.check_add_to_bom(c, recursive=False))
+
+        with self.assertRaises(django_exceptions.ValidationError):
+            BomItem.objects.create(part=c, sub_part=a, quantity=1)
+
+    def test_recursive_reference_wide_bom(self):
+        """Test circular reference checks for a BOM with a large number of parts on a single level"""
+        top = Part.objects.create(name='Top', description='Top level assembly', assembly=True)
+        parent = Part.objects.create(name='Parent', description='Parent assembly', assembly=True)
+        template = Part.objects.create(name='Template', description='Template component', is_template=True, assembly=True)
+
+        # Half of the components are variants of the template part
+        components = [
+            Part.objects.create(
+                name=f'Component {idx}',
+                description='A component',
+                component=True,
+                variant_of=template if idx % 2 else None,
+            ) for idx in range(600)
+        ]
+
+        BomItem.objects.bulk_create([
+            BomItem(part=top, sub_part=component, quantity=1) for component in components
+        ])
+
+        self.assertTrue(top.check_add_to_bom(parent))
+
+        # Variant components inherit the BOM of the template part
+        BomItem.objects.create(part=template, sub_part=parent, quantity=1, inherited=True)
+
+        self.assertFalse(top.check_add_to_bom(parent))
+
+        with self.assertRaises(django_exceptions.ValidationError):
+            BomItem.objects.create(part=parent, sub_part=top, quantity=1)
+
+    def test_required_build_order_quantity(self):
+        """Test calculation of the quantity required for active build orders."""
+        assembly = Part.objects.create(name='Assy', description='An assembly', assembly=True, is_template=True)
+        variant = Part.objects.create(name='Assy variant', description='A variant', assembly=True, variant_of=assembly)
+        component = Part.objects.create(name='Comp', description='A component', component=True)
+
+        BomItem.objects.create(part=assembly, sub_part=component, quantity=3, inherited=True)
+
+        self.assertEqual(component.required_build_order_quantity(), 0)
+
+        Build.objects.create(reference='BO-9990', part=assembly, title='Build the assembly', quantity=10)
+        Build.objects.create(reference='BO-9991', part=variant, title='Build the variant', quantity=5)
+
+        # The BOM item is inherited, so the variant build requires the component also
+        self.assertEqual(component.required_build_order_quantity(), 45)
+
+    def test_bulk_import(self):
+        """Test creation of multiple BomItem objects via bulk_import()"""
+        assembly = Part.objects.create(name='Assy', description='An assembly', assembly=True)
+        components = [
+            Part.objects.create(name=f'Comp {idx}', description='A component', component=True) for idx in range(5)
+        ]
+
+        BomItem.objects.create(part=assembly, sub_part=components[0], quantity=1)
+
+        rows = [{'part': assembly, 'sub_part': c, 'quantity': 2} for c in components]
+
+        # Duplicate rows are ignored
+        rows.append({'part': assembly, 'sub_part': components[1], 'quantity': 3})
+
+        # Record post_save signals sent for created items
+        created_ids = []
+
+        def on_save(sender, instance, created=False, **kwargs):
+            if created:
+                created_ids.append(instance.pk)
+
+        post_save.connect(on_save, sender=BomItem)
+
+        try:
+            items = BomItem.bulk_import(rows, batch_size=2)
+        finally:
+            post_save.disconnect(on_save, sender=BomItem)
+
+        self.assertEqual(len(items), 4)
+
+        # Primary key values are available for the created items
+        for item in items:
+            self.assertEqual(BomItem.objects.get(pk=item.pk).sub_part, item.sub_part)
+
+        self.assertEqual(created_ids, [item.pk for item in items])
+
+        self.assertEqual(assembly.bom_items.count(), 5)
+        self.assertEqual(assembly.bom_items.get(sub_part=components[1]).quantity, 2)
+
+        # Importing the same rows again does not create any new items
+        self.assertEqual(len(BomItem.bulk_import(rows)), 0)
+
+        # Items are validated before creation
+        with self.assertRaises(django_exceptions.ValidationError):
+            BomItem.bulk_import([{'part': assembly, 'sub_part': assembly, 'quantity': 1}])
+
     def test_integer_quantity(self):
         """Test integer validation for BomItem."""
         p = Part.objects.create(name="test", description="d", component=True, trackable=True)
@@ -245,3 +381,9 @@ class BomItemTest(TestCase):
         )
 
         self.assertEqual(assembly.can_build, 20)
+
+        # The annotated value matches the calculated value
+        annotated = Part.objects.with_related(can_build=True).get(pk=assembly.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(annotated.can_build, 20)
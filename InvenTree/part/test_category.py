@@ -1,5 +1,7 @@
 """Unit tests for the PartCategory model"""
 
+from unittest import mock
+
 from django.core.exceptions import ValidationError
 from django.test import TestCase
 
@@ -145,6 +147,10 @@ class CategoryTest(TestCase):
 
         self.assertEqual(self.electronics.item_count, self.electronics.partcount())
 
+        # Counting parts across the entire subtree requires only a single query
+        with self.assertNumQueries(1):
+            self.electronics.partcount()
+
     def test_parameters(self):
         """Test that the Category parameters are correctly fetched."""
         # Check number of SQL queries to iterate other parameters
@@ -182,7 +188,14 @@ class CategoryTest(TestCase):
         self.assertEqual(transceivers.parent, self.electronics)
 
         # Now delete the 'fasteners' category - the parts should move to 'mechanical'
-        self.fasteners.delete()
+        fastener_ids = set(self.fasteners.parts.values_list('pk', flat=True))
+
+        with mock.patch('part.models.trigger_event') as trigger:
+            self.fasteners.delete()
+
+        # A 'saved' event is triggered for each part which was moved
+        saved_ids = {c.kwargs['id'] for c in trigger.call_args_list if c.args[0] == 'part_part.saved'}
+        self.assertEqual(saved_ids, fastener_ids)
 
         fasteners = Part.objects.filter(description__contains='screw')
 
@@ -236,6 +236,21 @@ class PartTest(TestCase):
         self.assertIsNone(orphan.category)
         self.assertEqual(orphan.category_path, '')
 
+    def test_with_related(self):
+        """Test that the with_related() queryset fetches related data up front"""
+        parts = list(Part.objects.with_related().filter(category__isnull=False))
+
+        self.assertEqual(len(parts), Part.objects.filter(category__isnull=False).count())
+
+        # Related data has already been fetched
+        with self.assertNumQueries(0):
+            for p in parts:
+                self.assertIsNotNone(p.category)
+                self.assertEqual(p.supplier_count, 0)
+
+                if p.is_leaf_node():
+                    self.assertEqual(p.total_stock, 0)
+
     def test_rename_img(self):
         """Test that an image can be renamed"""
         img = rename_part_image(self.r1, 'hello.png')
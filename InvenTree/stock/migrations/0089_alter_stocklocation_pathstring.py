@@ -0,0 +1,18 @@
+# Generated by Django 3.2.16 on 2026-10-15 21:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stock', '0088_remove_stockitem_infinite'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='stocklocation',
+            name='pathstring',
+            field=models.CharField(blank=True, db_index=True, help_text='Path', max_length=250, verbose_name='Path'),
+        ),
+    ]
@@ -263,6 +263,11 @@ class StockTest(StockTestBase):
 
         self.assertEqual(part.quantity_being_built, 1)
 
+        # An over-completed build does not reduce the quantity being built
+        Build.objects.create(reference='BO-4445', part=part, title='Another test build', quantity=5, completed=10)
+
+        self.assertEqual(part.quantity_being_built, 1)
+
     def test_loc_count(self):
         """Test count function."""
         self.assertEqual(StockLocation.objects.count(), 7)